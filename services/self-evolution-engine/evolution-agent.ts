@@ -323,38 +323,44 @@ class DynamicTaskGraph extends EventEmitter {
   private maxConcurrency: number = 16;
   
   async executeAsync(workflow: TaskNode[]): Promise<void> {
-    // Build dependency graph
-    workflow.forEach(node => this.nodes.set(node.id, node));
+    // Build dependency graph once (Kahn's algorithm: indegree + dependents)
+    const indegree = new Map<string, number>();
+    const children = new Map<string, string[]>();
+    workflow.forEach(node => {
+      this.nodes.set(node.id, node);
+      indegree.set(node.id, node.dependencies.length);
+      children.set(node.id, []);
+    });
+    workflow.forEach(node =>
+      node.dependencies.forEach(dep => children.get(dep)?.push(node.id))
+    );
     
     // Execute with dynamic parallelization
-    const ready = this.getReadyTasks();
-    const executing: Promise<any>[] = [];
+    const ready = workflow.filter(node => indegree.get(node.id) === 0);
+    const executing: Map<string, Promise<string>> = new Map();
     
-    while (ready.length > 0 || executing.length > 0) {
-      // Launch ready tasks up to concurrency limit
-      while (ready.length > 0 && executing.length < this.maxConcurrency) {
+    while (ready.length > 0 || executing.size > 0) {
+      // Launch ready tasks up to concurrency limit, highest priority first
+      ready.sort((a, b) => b.priority - a.priority);
+      while (ready.length > 0 && executing.size < this.maxConcurrency) {
         const task = ready.shift()!;
         const promise = this.executeTask(task);
-        executing.push(promise);
+        executing.set(task.id, promise.then(() => task.id));
         this.executionPool.set(task.id, promise);
       }
       
-      // Wait for any task to complete
-      const completed = await Promise.race(executing);
-      const index = executing.indexOf(completed);
-      executing.splice(index, 1);
+      // Wait for any task to complete, then release only its dependents
+      const completedId = await Promise.race(executing.values());
+      executing.delete(completedId);
       
-      // Check for newly ready tasks
-      ready.push(...this.getReadyTasks());
+      for (const childId of children.get(completedId)!) {
+        const remaining = indegree.get(childId)! - 1;
+        indegree.set(childId, remaining);
+        if (remaining === 0) ready.push(this.nodes.get(childId)!);
+      }
     }
   }
   
-  private getReadyTasks(): TaskNode[] {
-    return Array.from(this.nodes.values()).filter(node => 
-      node.dependencies.every(dep => this.executionPool.has(dep))
-    ).sort((a, b) => b.priority - a.priority);
-  }
-  
   private async executeTask(task: TaskNode): Promise<any> {
     // Bayesian priority-based scheduling
     const priority = this.calculateBayesianPriority(task);